@@ -12,6 +12,7 @@ from .model import (
     BoardType,
     Piece,
     Move,
+    MoveBatch,
     Board,
     Dice,
     DiceType,
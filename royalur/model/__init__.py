@@ -15,7 +15,7 @@ from .shape import (
     BoardShape, BoardType,
     StandardBoardShape, AsebBoardShape,
 )
-from .board import Piece, Move, Board
+from .board import Piece, Move, MoveBatch, Board
 from .dice import (
     Roll, Dice, DiceType,
     BinaryDice, BinaryDice0AsMax,
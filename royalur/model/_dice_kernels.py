@@ -0,0 +1,62 @@
+"""
+Native kernels for rolling binary dice inside simulation loops.
+
+These are compiled with Numba when it is installed, so that
+simulations that are themselves compiled with Numba can roll
+dice without calling back into Python. The first call to each
+kernel pays a one-time compilation cost, which is cached on disk
+across runs. If Numba is not installed, these kernels run as
+plain Python functions.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+
+@njit(cache=True)
+def binary_roll(n_die: int) -> int:
+    """
+    Rolls n_die binary die and counts the result.
+    """
+    value = 0
+    for _ in range(n_die):
+        # Simulate rolling a single D2 dice.
+        if np.random.random() < 0.5:
+            value += 1
+
+    return value
+
+
+@njit(cache=True)
+def binary0max_roll(n_die: int) -> int:
+    """
+    Rolls n_die binary die and counts the result, where a
+    roll of zero represents the highest roll, n_die + 1.
+    """
+    value = binary_roll(n_die)
+    return n_die + 1 if value == 0 else value
+
+
+@njit(cache=True)
+def binary_roll_many(out: np.ndarray, n_die: int):
+    """
+    Fills out with rolls of n_die binary die.
+    """
+    for index in range(out.shape[0]):
+        out[index] = binary_roll(n_die)
+
+
+@njit(cache=True)
+def binary0max_roll_many(out: np.ndarray, n_die: int):
+    """
+    Fills out with rolls of n_die binary die, where a
+    roll of zero represents the highest roll, n_die + 1.
+    """
+    for index in range(out.shape[0]):
+        out[index] = binary0max_roll(n_die)
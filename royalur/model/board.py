@@ -2,7 +2,12 @@ from .tile import Tile
 from .player import PlayerType
 from .shape import BoardShape
 from .path import PathPair
-from typing import Optional, Union
+from typing import ClassVar, Iterable, Iterator, Optional, Union
+import numpy as np
+
+_PLAYERS_BY_VALUE: dict[int, PlayerType] = {
+    player.value: player for player in PlayerType
+}
 
 
 class Piece:
@@ -10,10 +15,13 @@ class Piece:
     A piece on a board.
     """
 
-    __slots__ = ("_owner", "_path_index")
+    __slots__ = ("_owner", "_path_index", "_code")
 
     _owner: PlayerType
     _path_index: int
+    _code: int
+
+    _cache: ClassVar[dict[int, 'Piece']] = {}
 
     def __init__(self, owner: PlayerType, path_index: int):
         """
@@ -33,6 +41,7 @@ class Piece:
 
         self._owner = owner
         self._path_index = path_index
+        self._code = Piece.pack(owner, path_index)
 
     @property
     def owner(self) -> PlayerType:
@@ -48,14 +57,56 @@ class Piece:
         """
         return self._path_index
 
+    @property
+    def code(self) -> int:
+        """
+        The packed integer encoding of this piece.
+        """
+        return self._code
+
+    @staticmethod
+    def pack(owner: PlayerType, path_index: int) -> int:
+        """
+        Packs the owner and path index of a piece into a single
+        positive integer. The owner is held in the lowest two bits,
+        and the path index in the bits above them. A code of zero
+        is never produced, so it may be used to represent no piece.
+        """
+        return (path_index << 2) | owner.value
+
+    @staticmethod
+    def code_of(piece: Optional["Piece"]) -> int:
+        """
+        Gets the packed integer encoding of the given piece,
+        or zero if there is no piece.
+        """
+        return piece._code if piece is not None else 0
+
+    @staticmethod
+    def unpack(code: int) -> Optional["Piece"]:
+        """
+        Gets the piece represented by the given packed integer
+        encoding, or None if the code is zero. The returned pieces
+        are cached, so the same code always returns the same piece.
+        """
+        if code == 0:
+            return None
+
+        piece = Piece._cache.get(code)
+        if piece is None:
+            piece = Piece(_PLAYERS_BY_VALUE[code & 3], code >> 2)
+            piece = Piece._cache.setdefault(code, piece)
+
+        return piece
+
     def __hash__(self) -> int:
-        return hash((self._owner, self._path_index))
+        return self._code
 
     def __eq__(self, other: object) -> bool:
-        if type(other) is not type(self):
-            return False
+        if other.__class__ is not Piece:
+            return NotImplemented
 
-        return self._owner == other._owner and self._path_index == other._path_index
+        return self._code == other._code
 
     @staticmethod
     def to_char(piece: Optional["Piece"]) -> str:
@@ -285,6 +336,10 @@ class Move:
         "_dest",
         "_dest_piece",
         "_captured_piece",
+        "_source_piece_code",
+        "_dest_piece_code",
+        "_captured_piece_code",
+        "_hash",
     )
 
     _player: PlayerType
@@ -293,6 +348,10 @@ class Move:
     _dest: Optional[Tile]
     _dest_piece: Optional[Piece]
     _captured_piece: Optional[Piece]
+    _source_piece_code: int
+    _dest_piece_code: int
+    _captured_piece_code: int
+    _hash: int
 
     def __init__(
         self,
@@ -322,6 +381,14 @@ class Move:
         self._dest = dest
         self._dest_piece = dest_piece
         self._captured_piece = captured_piece
+        self._source_piece_code = Piece.code_of(source_piece)
+        self._dest_piece_code = Piece.code_of(dest_piece)
+        self._captured_piece_code = Piece.code_of(captured_piece)
+        self._hash = hash((
+            source, self._source_piece_code,
+            dest, self._dest_piece_code,
+            self._captured_piece_code,
+        ))
 
     @property
     def player(self) -> PlayerType:
@@ -490,39 +557,242 @@ class Move:
             return "Introduce and score a piece"
 
         if scoring:
-            return f"Score a piece from {self.get_source()}"
-
-        builder = []
-        if introducing:
-            builder.append("Introduce a piece to ")
-        else:
-            builder.append(f"Move {self.get_source()} to ")
+            return f"Score a piece from {self._source}"
 
-        if self.is_capture():
-            builder.append("capture ")
-
-        builder.append(str(self.get_dest()))
-        return "".join(builder)
+        prefix = "Introduce a piece to " if introducing else f"Move {self._source} to "
+        capture = "capture " if self._captured_piece is not None else ""
+        return f"{prefix}{capture}{self._dest}"
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self._source,
-                self._source_piece,
-                self._dest,
-                self._dest_piece,
-                self._captured_piece,
-            )
-        )
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        if type(other) is not type(self):
+        if other.__class__ is not Move:
+            return NotImplemented
+        if self._hash != other._hash:
             return False
 
         return (
             self._source == other._source
-            and self._source_piece == other._source_piece
+            and self._source_piece_code == other._source_piece_code
             and self._dest == other._dest
-            and self._dest_piece == other._dest_piece
-            and self._captured_piece == other._captured_piece
+            and self._dest_piece_code == other._dest_piece_code
+            and self._captured_piece_code == other._captured_piece_code
         )
+
+
+class MoveBatch:
+    """
+    Stores a batch of moves as parallel arrays of their fields, so
+    that the moves can be filtered using vectorised operations.
+    Tiles are stored by their x and y coordinates, where an x
+    of 0 represents no tile. Pieces are stored by their packed
+    integer codes, where a code of 0 represents no piece. Moves
+    with y-coordinates above 32767, or with piece codes above
+    2147483647, cannot be stored.
+    """
+
+    _MAX_Y: ClassVar[int] = int(np.iinfo(np.int16).max)
+    _MAX_CODE: ClassVar[int] = int(np.iinfo(np.int32).max)
+
+    _ARRAYS: ClassVar[tuple[str, ...]] = (
+        "_player",
+        "_src_x",
+        "_src_y",
+        "_src_code",
+        "_dst_x",
+        "_dst_y",
+        "_dst_code",
+        "_captured_code",
+    )
+    """
+    The names of the attributes that hold the arrays of this batch.
+    """
+
+    __slots__ = (
+        "_size",
+        "_player",
+        "_src_x",
+        "_src_y",
+        "_src_code",
+        "_dst_x",
+        "_dst_y",
+        "_dst_code",
+        "_captured_code",
+    )
+
+    _size: int
+    _player: np.ndarray
+    _src_x: np.ndarray
+    _src_y: np.ndarray
+    _src_code: np.ndarray
+    _dst_x: np.ndarray
+    _dst_y: np.ndarray
+    _dst_code: np.ndarray
+    _captured_code: np.ndarray
+
+    def __init__(self, capacity: int = 16):
+        self._size = 0
+        self._player = np.empty(capacity, dtype=np.int8)
+        self._src_x = np.empty(capacity, dtype=np.int8)
+        self._src_y = np.empty(capacity, dtype=np.int16)
+        self._src_code = np.empty(capacity, dtype=np.int32)
+        self._dst_x = np.empty(capacity, dtype=np.int8)
+        self._dst_y = np.empty(capacity, dtype=np.int16)
+        self._dst_code = np.empty(capacity, dtype=np.int32)
+        self._captured_code = np.empty(capacity, dtype=np.int32)
+
+    @staticmethod
+    def from_moves(moves: Iterable[Move]) -> "MoveBatch":
+        """
+        Creates a batch containing all of the given moves.
+        """
+        moves = list(moves)
+        batch = MoveBatch(len(moves))
+        for move in moves:
+            batch.add(move)
+        return batch
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of moves that can be stored before
+        the arrays of this batch need to be grown.
+        """
+        return len(self._player)
+
+    def _grow(self):
+        """
+        Doubles the capacity of this batch.
+        """
+        capacity = max(1, 2 * self.capacity)
+        for name in MoveBatch._ARRAYS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def add(self, move: Move):
+        """
+        Appends the given move to the end of this batch.
+        """
+        source = move._source
+        dest = move._dest
+        src_y = source._y if source is not None else 0
+        dst_y = dest._y if dest is not None else 0
+        if src_y > MoveBatch._MAX_Y or dst_y > MoveBatch._MAX_Y:
+            raise ValueError(
+                f"Tiles with a y-coordinate above {MoveBatch._MAX_Y} "
+                f"cannot be stored in a MoveBatch"
+            )
+        if max(
+            move._source_piece_code,
+            move._dest_piece_code,
+            move._captured_piece_code,
+        ) > MoveBatch._MAX_CODE:
+            raise ValueError(
+                f"Pieces with a code above {MoveBatch._MAX_CODE} "
+                f"cannot be stored in a MoveBatch"
+            )
+
+        if self._size >= self.capacity:
+            self._grow()
+
+        index = self._size
+        self._player[index] = move._player.value
+        self._src_x[index] = source._x if source is not None else 0
+        self._src_y[index] = src_y
+        self._src_code[index] = move._source_piece_code
+        self._dst_x[index] = dest._x if dest is not None else 0
+        self._dst_y[index] = dst_y
+        self._dst_code[index] = move._dest_piece_code
+        self._captured_code[index] = move._captured_piece_code
+        self._size += 1
+
+    def get(self, index: int) -> Move:
+        """
+        Materialises the move at the given index in this batch.
+        """
+        if index < 0 or index >= self._size:
+            raise IndexError(f"There is no move at index {index}")
+
+        src_x = int(self._src_x[index])
+        dst_x = int(self._dst_x[index])
+        return Move(
+            _PLAYERS_BY_VALUE[int(self._player[index])],
+            Tile(src_x, int(self._src_y[index])) if src_x != 0 else None,
+            Piece.unpack(int(self._src_code[index])),
+            Tile(dst_x, int(self._dst_y[index])) if dst_x != 0 else None,
+            Piece.unpack(int(self._dst_code[index])),
+            Piece.unpack(int(self._captured_code[index])),
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Move]:
+        for index in range(self._size):
+            yield self.get(index)
+
+    @property
+    def player(self) -> np.ndarray:
+        """
+        The values of the players that instigate each move.
+        """
+        return self._player[:self._size]
+
+    @property
+    def src_x(self) -> np.ndarray:
+        """
+        The x-coordinates of the source tiles of each move.
+        """
+        return self._src_x[:self._size]
+
+    @property
+    def src_y(self) -> np.ndarray:
+        """
+        The y-coordinates of the source tiles of each move.
+        """
+        return self._src_y[:self._size]
+
+    @property
+    def dst_x(self) -> np.ndarray:
+        """
+        The x-coordinates of the destination tiles of each move.
+        """
+        return self._dst_x[:self._size]
+
+    @property
+    def dst_y(self) -> np.ndarray:
+        """
+        The y-coordinates of the destination tiles of each move.
+        """
+        return self._dst_y[:self._size]
+
+    @property
+    def captured_code(self) -> np.ndarray:
+        """
+        The packed codes of the pieces captured by each move.
+        """
+        return self._captured_code[:self._size]
+
+    def is_capture_mask(self) -> np.ndarray:
+        """
+        Determines which moves in this batch capture an
+        existing piece on the board.
+        """
+        return self.captured_code != 0
+
+    def rosette_mask(self, shape: BoardShape) -> np.ndarray:
+        """
+        Determines which moves in this batch will land
+        a piece on a rosette of the given board shape.
+        """
+        lookup = shape.rosette_lookup
+        dst_x = self.dst_x
+        dst_y = self.dst_y
+        in_bounds = (dst_x < lookup.shape[0]) & (dst_y < lookup.shape[1])
+        return in_bounds & lookup[
+            np.where(in_bounds, dst_x, 0),
+            np.where(in_bounds, dst_y, 0),
+        ]
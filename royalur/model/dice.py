@@ -1,4 +1,8 @@
+import functools
+import itertools
+import math
 import random
+import numpy as np
 from enum import Enum
 from abc import ABC, abstractmethod
 from overrides import overrides
@@ -43,7 +47,7 @@ class Dice(ABC):
         """
         return self._name
 
-    def has_state() -> bool:
+    def has_state(self) -> bool:
         """
         Returns whether this dice holds any state that
         affects its dice rolls. If this is overriden,
@@ -51,7 +55,7 @@ class Dice(ABC):
         """
         return False
 
-    def copy_from(self, other: 'Dice') -> bool:
+    def copy_from(self, other: 'Dice') -> None:
         """
         Copies the state of the other dice into this dice.
         If the dice does not have state, this is a no-op.
@@ -66,11 +70,11 @@ class Dice(ABC):
         pass
 
     @abstractmethod
-    def get_roll_probabilities(self) -> list[float]:
+    def get_roll_probabilities(self) -> tuple[float, ...]:
         """
         Gets the probability of rolling each value of
         the dice, where the index into the returned
-        array represents the value of the roll.
+        tuple represents the value of the roll.
         """
         pass
 
@@ -83,6 +87,24 @@ class Dice(ABC):
         """
         pass
 
+    def roll_values_batch(
+            self,
+            n: int,
+            rng: np.random.Generator | None = None
+    ) -> np.ndarray:
+        """
+        Generates n random rolls using this dice, and returns
+        just their values as an array of int8. Dice without state
+        may draw all of the rolls at once using rng, or a fresh
+        default generator if no rng is provided. Dice with state
+        roll each value in turn using roll_value.
+        """
+        values = np.empty(n, dtype=np.int8)
+        for index in range(n):
+            values[index] = self.roll_value()
+
+        return values
+
     def record_roll(self, value: int):
         """
         Updates the state of this dice after having rolled value.
@@ -113,22 +135,25 @@ class BinaryDice(Dice):
     """
     Rolls a number of binary die and counts the result.
     """
-    __slots__ = ("_num_die", "_roll_probabilities")
+    __slots__ = ("_num_die", "_roll_probabilities", "_cdf", "_roll_cache")
 
     _num_die: int
-    _roll_probabilities: list[float]
+    _roll_probabilities: tuple[float, ...]
+    _cdf: tuple[float, ...]
+    _roll_cache: tuple[Roll, ...]
 
     def __init__(self, name: str, num_die: int):
         super().__init__(name)
         self._num_die = num_die
-        self._roll_probabilities = []
 
         # Binomial Distribution
-        baseProb = 0.5 ** num_die
-        nChooseK = 1
-        for roll in range(0, num_die + 1):
-            self._roll_probabilities.append(baseProb * nChooseK)
-            nChooseK = nChooseK * (num_die - roll) // (roll + 1)
+        base_prob = 0.5 ** num_die
+        self._roll_probabilities = tuple(
+            math.comb(num_die, roll) * base_prob
+            for roll in range(num_die + 1)
+        )
+        self._cdf = tuple(itertools.accumulate(self._roll_probabilities))
+        self._roll_cache = tuple(Roll(value) for value in range(num_die + 1))
 
     @property
     def num_die(self) -> int:
@@ -142,25 +167,35 @@ class BinaryDice(Dice):
         return self._num_die
 
     @overrides
-    def get_roll_probabilities(self) -> list[float]:
+    def get_roll_probabilities(self) -> tuple[float, ...]:
         return self._roll_probabilities
 
     @overrides
     def roll_value(self) -> int:
-        value = 0
-        for _ in range(self._num_die):
-            # Simulate rolling a single D2 dice.
-            if random.random() >= 0.5:
-                value += 1
+        # Each random bit simulates rolling a single D2 dice.
+        return random.getrandbits(self._num_die).bit_count()
 
-        return value
+    @overrides
+    def roll_values_batch(
+            self,
+            n: int,
+            rng: np.random.Generator | None = None
+    ) -> np.ndarray:
+        if self.has_state():
+            return super().roll_values_batch(n, rng)
+        if rng is None:
+            rng = np.random.default_rng()
+
+        # Sample each roll from the cumulative distribution.
+        values = np.searchsorted(self._cdf, rng.random(n), side="right")
+        return values.astype(np.int8)
 
     @overrides
     def generate_roll(self, value: int) -> Roll:
         if value < 0 or value > self._num_die:
             raise ValueError(f"This dice cannot roll {value}")
 
-        return Roll(value)
+        return self._roll_cache[value]
 
 
 class BinaryDice0AsMax(BinaryDice):
@@ -175,27 +210,31 @@ class BinaryDice0AsMax(BinaryDice):
     def __init__(self, name: str, num_die: int):
         super().__init__(name, num_die)
         self._max_roll_value = num_die + 1
-        self._roll_probabilities = [
-            0,
+        self._roll_probabilities = (
+            0.0,
             *self._roll_probabilities[1:],
             self._roll_probabilities[0]
-        ]
+        )
+        self._cdf = tuple(itertools.accumulate(self._roll_probabilities))
+        self._roll_cache = tuple(
+            Roll(value) for value in range(self._max_roll_value + 1)
+        )
 
     @overrides
     def get_max_roll_value(self) -> int:
-        return self.max_roll_value
+        return self._max_roll_value
 
     @overrides
     def roll_value(self) -> int:
-        value = super().roll_value()
-        return self.max_roll_value if value == 0 else value
+        value: int = random.getrandbits(self._num_die).bit_count()
+        return self._max_roll_value if value == 0 else value
 
     @overrides
     def generate_roll(self, value: int) -> Roll:
-        if value <= 0 or value > self.max_roll_value:
+        if value <= 0 or value > self._max_roll_value:
             raise ValueError(f"This dice cannot roll {value}")
 
-        return Roll(value)
+        return self._roll_cache[value]
 
 
 class DiceType(Enum):
@@ -205,7 +244,7 @@ class DiceType(Enum):
 
     FOUR_BINARY = (
         1, "FourBinary",
-        lambda: BinaryDice("FourBinary", 4)
+        functools.partial(BinaryDice, "FourBinary", 4)
     )
     """
     The standard board shape.
@@ -213,7 +252,7 @@ class DiceType(Enum):
 
     THREE_BINARY_0MAX = (
         2, "ThreeBinary0Max",
-        lambda: BinaryDice0AsMax("ThreeBinary0Max", 3)
+        functools.partial(BinaryDice0AsMax, "ThreeBinary0Max", 3)
     )
     """
     The Aseb board shape.
@@ -39,12 +39,7 @@ class PlayerType(Enum):
         """
         Retrieve the PlayerType representing the other player.
         """
-        if self == PlayerType.LIGHT:
-            return PlayerType.DARK
-        elif self == PlayerType.DARK:
-            return PlayerType.LIGHT
-        else:
-            raise ValueError(f"Unknown PlayerType {self}")
+        return _OTHER_PLAYERS[self]
 
     @staticmethod
     def to_char(player: Optional['PlayerType']) -> str:
@@ -52,7 +47,19 @@ class PlayerType(Enum):
         Convert the player to a single character used to
         represent the player in shorthand notations.
         """
-        return player.character if player else '.'
+        return _PLAYER_CHARACTERS[player]
+
+
+_OTHER_PLAYERS: dict[PlayerType, PlayerType] = {
+    PlayerType.LIGHT: PlayerType.DARK,
+    PlayerType.DARK: PlayerType.LIGHT,
+}
+
+_PLAYER_CHARACTERS: dict[Optional[PlayerType], str] = {
+    None: '.',
+    PlayerType.LIGHT: PlayerType.LIGHT.character,
+    PlayerType.DARK: PlayerType.DARK.character,
+}
 
 
 class PlayerState:
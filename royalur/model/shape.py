@@ -2,6 +2,7 @@ from .tile import Tile
 from .path import BellPathPair, AsebPathPair
 from enum import Enum
 from typing import Iterable, Callable
+import numpy as np
 
 
 class BoardShape:
@@ -9,13 +10,17 @@ class BoardShape:
     Holds the shape of a board as a grid, and includes
     the location of all rosette tiles.
     """
-    __slots__ = ("_name", "_tiles", "_rosettes", "_width", "_height")
+    __slots__ = (
+        "_name", "_tiles", "_rosettes", "_width", "_height",
+        "_rosette_lookup",
+    )
 
     _name: str
     _tiles: set[Tile]
     _rosettes: set[Tile]
     _width: int
     _height: int
+    _rosette_lookup: np.ndarray
 
     def __init__(
             self,
@@ -52,6 +57,13 @@ class BoardShape:
         self._width = max(x_values)
         self._height = max(y_values)
 
+        self._rosette_lookup = np.zeros(
+            (self._width + 1, self._height + 1), dtype=bool
+        )
+        for rosette in rosettes:
+            self._rosette_lookup[rosette.x, rosette.y] = True
+        self._rosette_lookup.flags.writeable = False
+
     @property
     def name(self) -> str:
         """
@@ -87,6 +99,16 @@ class BoardShape:
         """
         return self._height
 
+    @property
+    def rosette_lookup(self) -> np.ndarray:
+        """
+        A read-only boolean array indexed by the [x, y] coordinates
+        of tiles, which is True for the rosette tiles of this board
+        shape. The x and y coordinates are 1-based, so the row and
+        column at index 0 are always False.
+        """
+        return self._rosette_lookup
+
     @property
     def area(self) -> int:
         """
@@ -133,7 +155,7 @@ class BoardShape:
         """
         if ix < 0 or iy < 0 or ix >= self._width or iy >= self._height:
             return False
-        return self.isRosette(Tile.from_indices(ix, iy))
+        return bool(self._rosette_lookup[ix + 1, iy + 1])
 
     def is_equivalent(self, other: 'BoardShape') -> bool:
         """
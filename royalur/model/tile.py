@@ -1,17 +1,26 @@
+from typing import ClassVar
+
+_X_TO_CHAR: tuple[str, ...] = tuple(chr(ord('A') - 1 + x) for x in range(27))
+_CHAR_TO_X: dict[str, int] = {c: x for x, c in enumerate(_X_TO_CHAR)}
 
 
 class Tile:
     """
-    Represents a position on or off the board.
+    Represents a position on or off the board. Tiles are interned,
+    so that constructing the same coordinates twice returns the
+    same instance.
     """
-    __slots__ = ("_x", "_y", "_ix", "_iy")
+    __slots__ = ("_x", "_y", "_ix", "_iy", "_hash")
 
     _x: int
     _y: int
     _ix: int
     _iy: int
+    _hash: int
+
+    _cache: ClassVar[dict[int, 'Tile']] = {}
 
-    def __init__(self, x: int, y: int):
+    def __new__(cls, x: int, y: int) -> 'Tile':
         if x < 1 or x > 26:
             raise ValueError(
                 f"x must fall within the range [1, 26]. Invalid value: {x}"
@@ -21,10 +30,24 @@ class Tile:
                 f"y must not be negative. Invalid value: {y}"
             )
 
-        self._x = x
-        self._y = y
-        self._ix = x - 1
-        self._iy = y - 1
+        # x always fits within 5 bits, whereas y is unbounded.
+        key = (y << 5) | x
+        tile = Tile._cache.get(key)
+        if tile is not None:
+            return tile
+
+        tile = super().__new__(cls)
+        tile._x = x
+        tile._y = y
+        tile._ix = x - 1
+        tile._iy = y - 1
+        tile._hash = key
+        # Another thread may have interned these coordinates since the
+        # lookup above, so always return the instance that was stored.
+        return Tile._cache.setdefault(key, tile)
+
+    def __reduce__(self):
+        return Tile, (self._x, self._y)
 
     @property
     def x(self) -> int:
@@ -78,17 +101,13 @@ class Tile:
             return Tile(self._x + (1 if dx > 0 else -1), self._y)
 
     def __hash__(self) -> int:
-        return hash((self._x, self._y))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        if type(other) is not type(self):
-            return False
-
-        return self._x == other._x and self._y == other._y
+        return self is other
 
     def __repr__(self) -> str:
-        encoded_x = chr(self._x + (ord('A') - 1))
-        return f"{encoded_x}{self._y}"
+        return f"{_X_TO_CHAR[self._x]}{self._y}"
 
     def __str__(self) -> str:
         return repr(self)
@@ -103,19 +122,24 @@ class Tile:
                 "Incorrect format, expected at least two characters"
             )
 
-        x = ord(encoded[0]) - (ord('A') - 1)
-        y = int(encoded[1:])
-        return Tile(x, y)
+        x = _CHAR_TO_X.get(encoded[0])
+        if x is None:
+            raise ValueError(
+                f"x must be encoded as a letter in the range [A, Z]. "
+                f"Invalid value: {encoded[0]}"
+            )
+
+        return Tile(x, int(encoded[1:]))
 
     @staticmethod
-    def create_list(*coordinates: list[tuple[int, int]]) -> list['Tile']:
+    def create_list(*coordinates: tuple[int, int]) -> list['Tile']:
         """
         Constructs a list of tiles from the tile coordinates.
         """
         return [Tile(x, y) for x, y in coordinates]
 
     @staticmethod
-    def create_path(*coordinates: list[tuple[int, int]]) -> list['Tile']:
+    def create_path(*coordinates: tuple[int, int]) -> list['Tile']:
         """
         Constructs a path from waypoints on the board.
         """
@@ -127,8 +151,27 @@ class Tile:
         for index in range(1, len(waypoints)):
             current = waypoints[index - 1]
             next = waypoints[index]
-            while current != next:
-                current = current.step_towards(next)
-                path.append(current)
+            x, y = current._x, current._y
+            dx = next._x - x
+            dy = next._y - y
+
+            if dx == 0:
+                step = 1 if dy > 0 else -1
+                path.extend(Tile(x, y + i) for i in range(step, dy + step, step))
+            elif dy == 0:
+                step = 1 if dx > 0 else -1
+                path.extend(Tile(x + i, y) for i in range(step, dx + step, step))
+            else:
+                # Diagonal segments are walked one step at a time.
+                while current != next:
+                    current = current.step_towards(next)
+                    path.append(current)
 
         return path
+
+
+# Intern the tiles of all common board shapes up front.
+for _x in range(1, 27):
+    for _y in range(0, 17):
+        Tile(_x, _y)
+del _x, _y
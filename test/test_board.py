@@ -0,0 +1,119 @@
+import unittest
+import random
+from royalur import (
+    BoardType, Game, Piece, Move, MoveBatch, PlayerType, Tile,
+)
+
+
+class TestBoard(unittest.TestCase):
+
+    def test_piece_codes(self):
+        for player in PlayerType:
+            for path_index in range(20):
+                piece = Piece(player, path_index)
+                self.assertNotEqual(0, piece.code)
+                self.assertEqual(piece, Piece.unpack(piece.code))
+                self.assertIs(
+                    Piece.unpack(piece.code), Piece.unpack(piece.code)
+                )
+
+        self.assertIsNone(Piece.unpack(0))
+        self.assertEqual(0, Piece.code_of(None))
+        self.assertNotEqual(
+            Piece(PlayerType.LIGHT, 3), Piece(PlayerType.DARK, 3)
+        )
+
+    def test_move_equality(self):
+        def create_move(captured: bool) -> Move:
+            return Move(
+                PlayerType.LIGHT,
+                Tile(1, 4), Piece(PlayerType.LIGHT, 3),
+                Tile(2, 5), Piece(PlayerType.LIGHT, 5),
+                Piece(PlayerType.DARK, 8) if captured else None,
+            )
+
+        self.assertEqual(create_move(True), create_move(True))
+        self.assertEqual(hash(create_move(True)), hash(create_move(True)))
+        self.assertNotEqual(create_move(True), create_move(False))
+
+    def test_equality_with_other_types(self):
+        piece = Piece(PlayerType.LIGHT, 3)
+        self.assertNotEqual(piece, None)
+        self.assertNotEqual(piece, piece.code)
+        self.assertFalse(piece == "piece")
+
+    def test_describe(self):
+        light = PlayerType.LIGHT
+        self.assertEqual(
+            "Introduce a piece to A4",
+            Move(light, None, None, Tile(1, 4), Piece(light, 1), None)
+            .describe()
+        )
+        self.assertEqual(
+            "Move A4 to capture B5",
+            Move(
+                light, Tile(1, 4), Piece(light, 1),
+                Tile(2, 5), Piece(light, 2), Piece(PlayerType.DARK, 6),
+            ).describe()
+        )
+        self.assertEqual(
+            "Score a piece from A7",
+            Move(light, Tile(1, 7), Piece(light, 14), None, None, None)
+            .describe()
+        )
+        self.assertEqual(
+            "Introduce and score a piece",
+            Move(light, None, None, None, None, None).describe()
+        )
+
+    def test_move_batch(self):
+        random.seed(1234)
+        for game in [Game.create_finkel(), Game.create_aseb()]:
+            shape = game.rules.board_shape
+            while not game.is_finished():
+                if game.is_waiting_for_roll():
+                    game.roll_dice()
+                    continue
+
+                moves = game.find_available_moves()
+                batch = MoveBatch(1)
+                for move in moves:
+                    batch.add(move)
+
+                self.assertEqual(len(moves), len(batch))
+                self.assertEqual(moves, list(batch))
+                self.assertEqual(
+                    [move.is_capture() for move in moves],
+                    batch.is_capture_mask().tolist()
+                )
+                self.assertEqual(
+                    [move.is_dest_rosette(shape) for move in moves],
+                    batch.rosette_mask(shape).tolist()
+                )
+                game.make_move(random.choice(moves))
+
+    def test_move_batch_limits(self):
+        light = PlayerType.LIGHT
+        batch = MoveBatch()
+        moves = [
+            Move(light, None, None, Tile(1, 200), Piece(light, 1), None),
+            Move(
+                light, Tile(2, 32767), Piece(light, 300),
+                Tile(2, 1), Piece(light, (1 << 29) - 1), None,
+            ),
+        ]
+        for move in moves:
+            batch.add(move)
+
+        self.assertEqual(moves, list(batch))
+        self.assertEqual([False, False], batch.rosette_mask(
+            BoardType.STANDARD.create_board_shape()
+        ).tolist())
+
+        self.assertRaises(ValueError, batch.add, Move(
+            light, None, None, Tile(1, 32768), Piece(light, 1), None,
+        ))
+        self.assertRaises(ValueError, batch.add, Move(
+            light, None, None, Tile(1, 1), Piece(light, 1 << 29), None,
+        ))
+        self.assertEqual(2, len(batch))
@@ -0,0 +1,107 @@
+import unittest
+import random
+import numpy as np
+from royalur.model.dice import BinaryDice, BinaryDice0AsMax
+from royalur.model._dice_kernels import (
+    binary_roll_many, binary0max_roll_many,
+)
+
+
+class TestDice(unittest.TestCase):
+
+    def _check_rolls(self, dice, possible_values: set[int]):
+        seen = set()
+        for _ in range(2000):
+            value = dice.roll_value()
+            self.assertIn(value, possible_values)
+            seen.add(value)
+
+        self.assertEqual(possible_values, seen)
+
+    def test_binary_dice(self):
+        random.seed(1234)
+        dice = BinaryDice("FourBinary", 4)
+        self._check_rolls(dice, {0, 1, 2, 3, 4})
+
+    def test_binary_dice_0_as_max(self):
+        random.seed(1234)
+        dice = BinaryDice0AsMax("ThreeBinary0Max", 3)
+        self._check_rolls(dice, {1, 2, 3, 4})
+
+    def test_roll_values_batch(self):
+        rng = np.random.default_rng(1234)
+        values = BinaryDice("FourBinary", 4).roll_values_batch(2000, rng)
+        self.assertEqual((2000,), values.shape)
+        self.assertEqual(np.int8, values.dtype)
+        self.assertEqual({0, 1, 2, 3, 4}, set(values.tolist()))
+
+        values = BinaryDice0AsMax(
+            "ThreeBinary0Max", 3
+        ).roll_values_batch(2000, rng)
+        self.assertEqual(np.int8, values.dtype)
+        self.assertEqual({1, 2, 3, 4}, set(values.tolist()))
+
+    def test_dice_kernels(self):
+        out = np.zeros(2000, dtype=np.int8)
+        binary_roll_many(out, 4)
+        self.assertEqual({0, 1, 2, 3, 4}, set(out.tolist()))
+
+        binary0max_roll_many(out, 3)
+        self.assertEqual({1, 2, 3, 4}, set(out.tolist()))
+
+    def test_roll_probabilities(self):
+        self.assertEqual(
+            (1 / 16, 4 / 16, 6 / 16, 4 / 16, 1 / 16),
+            BinaryDice("FourBinary", 4).get_roll_probabilities()
+        )
+        self.assertEqual(
+            (0.0, 3 / 8, 3 / 8, 1 / 8, 1 / 8),
+            BinaryDice0AsMax("ThreeBinary0Max", 3).get_roll_probabilities()
+        )
+
+    def test_generate_roll(self):
+        dice = BinaryDice("FourBinary", 4)
+        self.assertEqual(4, dice.get_max_roll_value())
+        self.assertEqual(0, dice.roll(0).value)
+        self.assertEqual(4, dice.roll(4).value)
+        self.assertRaises(ValueError, dice.roll, 5)
+
+        dice = BinaryDice0AsMax("ThreeBinary0Max", 3)
+        self.assertEqual(4, dice.get_max_roll_value())
+        self.assertEqual(4, dice.roll(4).value)
+        self.assertGreaterEqual(dice.roll().value, 1)
+        self.assertRaises(ValueError, dice.roll, 0)
+        self.assertRaises(ValueError, dice.roll, 5)
+
+    def test_rolls_are_cached(self):
+        for dice in [
+            BinaryDice("FourBinary", 4),
+            BinaryDice0AsMax("ThreeBinary0Max", 3),
+        ]:
+            for value in range(1, dice.get_max_roll_value() + 1):
+                roll = dice.generate_roll(value)
+                self.assertEqual(value, roll.value)
+                self.assertIs(roll, dice.generate_roll(value))
+
+    def test_roll_values_batch_records_state(self):
+        class CountingDice(BinaryDice):
+            __slots__ = ("recorded",)
+
+            def __init__(self):
+                super().__init__("Counting", 4)
+                self.recorded = []
+
+            def has_state(self) -> bool:
+                return True
+
+            def roll_value(self) -> int:
+                value = super().roll_value()
+                self.record_roll(value)
+                return value
+
+            def record_roll(self, value: int):
+                self.recorded.append(value)
+
+        dice = CountingDice()
+        values = dice.roll_values_batch(50)
+        self.assertEqual(values.tolist(), dice.recorded)
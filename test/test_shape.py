@@ -0,0 +1,20 @@
+import unittest
+from royalur import BoardType, Tile
+
+
+class TestShape(unittest.TestCase):
+
+    def test_rosettes(self):
+        for board_type in BoardType:
+            shape = board_type.create_board_shape()
+            for ix in range(-1, shape.width + 1):
+                for iy in range(-1, shape.height + 1):
+                    is_rosette = shape.is_rosette_indices(ix, iy)
+                    self.assertIs(bool, type(is_rosette))
+                    if ix < 0 or iy < 0:
+                        self.assertFalse(is_rosette)
+                        continue
+
+                    tile = Tile.from_indices(ix, iy)
+                    self.assertEqual(tile in shape.rosettes, is_rosette)
+                    self.assertEqual(shape.is_rosette(tile), is_rosette)
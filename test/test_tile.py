@@ -0,0 +1,78 @@
+import unittest
+import pickle
+import sys
+import threading
+from royalur import Tile
+
+
+class TestTile(unittest.TestCase):
+
+    def test_tiles_are_interned(self):
+        self.assertIs(Tile(2, 4), Tile(2, 4))
+        self.assertIs(Tile(26, 300), Tile(26, 300))
+        self.assertIs(Tile(2, 4), Tile.from_indices(1, 3))
+        self.assertIs(Tile(2, 4), pickle.loads(pickle.dumps(Tile(2, 4))))
+
+    def test_interning_across_threads(self):
+        num_threads = 8
+        barrier = threading.Barrier(num_threads)
+        results: list[list[Tile]] = []
+
+        def create_tiles():
+            barrier.wait()
+            results.append([Tile(3, y) for y in range(1000, 3000)])
+
+        threads = [
+            threading.Thread(target=create_tiles)
+            for _ in range(num_threads)
+        ]
+        # Switch threads as often as possible to provoke races.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(num_threads, len(results))
+        for tiles in results[1:]:
+            for expected, tile in zip(results[0], tiles):
+                self.assertIs(expected, tile)
+
+    def test_equality(self):
+        self.assertEqual(Tile(1, 2), Tile(1, 2))
+        self.assertNotEqual(Tile(1, 2), Tile(2, 1))
+        self.assertNotEqual(Tile(1, 33), Tile(2, 1))
+        self.assertEqual(len({Tile(1, 2), Tile(1, 2), Tile(2, 1)}), 2)
+
+    def test_invalid_coordinates(self):
+        self.assertRaises(ValueError, Tile, 0, 1)
+        self.assertRaises(ValueError, Tile, 27, 1)
+        self.assertRaises(ValueError, Tile, 1, -1)
+
+    def test_create_path(self):
+        self.assertEqual(
+            Tile.create_list(
+                (1, 4), (1, 3), (1, 2), (2, 2), (3, 2), (3, 3), (3, 4),
+            ),
+            Tile.create_path((1, 4), (1, 2), (3, 2), (3, 4)),
+        )
+        self.assertEqual(
+            Tile.create_list((1, 1), (2, 1), (2, 2)),
+            Tile.create_path((1, 1), (1, 1), (2, 2)),
+        )
+
+    def test_encoding(self):
+        self.assertEqual("A1", str(Tile(1, 1)))
+        self.assertEqual("Z16", repr(Tile(26, 16)))
+        self.assertIs(Tile(2, 12), Tile.from_string("B12"))
+        for tile in Tile.create_path((1, 0), (26, 0), (26, 16)):
+            self.assertIs(tile, Tile.from_string(str(tile)))
+
+        self.assertRaises(ValueError, Tile.from_string, "A")
+        self.assertRaises(ValueError, Tile.from_string, "a1")
+        self.assertRaises(ValueError, Tile.from_string, "@1")
+        self.assertRaises(ValueError, Tile.from_string, "AB")